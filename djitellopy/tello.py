@@ -6,7 +6,7 @@ import logging
 import socket
 import time
 from collections import deque
-from threading import Thread, Lock
+from threading import Thread, Lock, Event
 from typing import Optional, Union, Type, Dict
 
 from .enforce_types import enforce_types
@@ -40,6 +40,7 @@ class Tello:
     TIME_BTW_COMMANDS = 0.1  # in seconds
     TIME_BTW_RC_CONTROL_COMMANDS = 0.001  # in seconds
     RETRY_COUNT = 1  # number of retries after a failed command
+    MIN_MOVE_DISTANCE = 20  # in cm, shorter moves are rejected by the drone
     TELLO_IP = '192.168.10.1'  # Tello IP address
 
     # Video stream, server socket
@@ -114,8 +115,9 @@ class Tello:
         self.address = (host, self.control_udp_port)
         self.stream_on = False
         self.retry_count = retry_count
-        self.last_received_command_timestamp = time.time()
-        self.last_rc_control_timestamp = time.time()
+        self.last_received_command_timestamp = time.monotonic()
+        self.last_rc_control_timestamp = time.monotonic()
+        self.last_speed: Optional[int] = None
 
         if not threads_initialized:
             # Set global ports from first instance
@@ -136,10 +138,10 @@ class Tello:
 
             threads_initialized = True
 
-        drones[host] = {'responses': [], 'state': {}}
+        drones[host] = {'responses': [], 'state': {}, 'response_received': Event(), 'command_lock': Lock()}
 
-        self.LOGGER.info("Tello instance was initialized. Host: '{}'. Control Port: '{}'. State Port: '{}'. Video Port: '{}'.".format(
-            host, self.control_udp_port, self.state_udp_port, vs_udp))
+        self.LOGGER.info("Tello instance was initialized. Host: '%s'. Control Port: '%s'. State Port: '%s'. Video Port: '%s'.",
+                         host, self.control_udp_port, self.state_udp_port, vs_udp)
 
         self.vs_udp_port = vs_udp
 
@@ -158,7 +160,7 @@ class Tello:
         """
         self.control_udp_port = port
         self.address = (self.address[0], port)
-        self.LOGGER.info(f"Control port set to: {port}")
+        self.LOGGER.info("Control port set to: %s", port)
 
     def set_state_port(self, port):
         """Set the state UDP port for receiving state information from the drone.
@@ -167,7 +169,7 @@ class Tello:
             port (int): The UDP port number for state information
         """
         self.state_udp_port = port
-        self.LOGGER.info(f"State port set to: {port}")
+        self.LOGGER.info("State port set to: %s", port)
 
     def set_video_port(self, port):
         """Set the video UDP port for receiving video stream from the drone.
@@ -177,7 +179,7 @@ class Tello:
         """
         self.vs_udp_port = port
         self.send_control_command(f'port 8890 {self.vs_udp_port}')
-        self.LOGGER.info(f"Video port set to: {port}")
+        self.LOGGER.info("Video port set to: %s", port)
 
     def get_port_configuration(self):
         """Get the current port configuration.
@@ -213,12 +215,13 @@ class Tello:
                 data, address = client_socket.recvfrom(1024)
 
                 address = address[0]
-                Tello.LOGGER.debug('Data received from {} at client_socket'.format(address))
+                Tello.LOGGER.debug('Data received from %s at client_socket', address)
 
                 if address not in drones:
                     continue
 
                 drones[address]['responses'].append(data)
+                drones[address]['response_received'].set()
 
             except Exception as e:
                 Tello.LOGGER.error(e)
@@ -241,7 +244,7 @@ class Tello:
                 data, address = state_socket.recvfrom(1024)
 
                 address = address[0]
-                Tello.LOGGER.debug('Data received from {} at state_socket'.format(address))
+                Tello.LOGGER.debug('Data received from %s at state_socket', address)
 
                 if address not in drones:
                     continue
@@ -259,7 +262,7 @@ class Tello:
         Internal method, you normally wouldn't call this yourself.
         """
         state = state.strip()
-        Tello.LOGGER.debug('Raw state data: {}'.format(state))
+        Tello.LOGGER.debug('Raw state data: %s', state)
 
         if state == 'ok':
             return {}
@@ -278,8 +281,8 @@ class Tello:
                 try:
                     value = num_type(value)
                 except ValueError as e:
-                    Tello.LOGGER.debug('Error parsing state value for {}: {} to {}'
-                                       .format(key, value, num_type))
+                    Tello.LOGGER.debug('Error parsing state value for %s: %s to %s',
+                                       key, value, num_type)
                     Tello.LOGGER.error(e)
                     continue
 
@@ -486,30 +489,41 @@ class Tello:
             bool/str: str with response text on success, False when unsuccessfull.
         """
         global client_socket
-        # Commands very consecutive makes the drone not respond to them.
-        # So wait at least self.TIME_BTW_COMMANDS seconds
-        diff = time.time() - self.last_received_command_timestamp
-        if diff < self.TIME_BTW_COMMANDS:
-            self.LOGGER.debug('Waiting {} seconds to execute command: {}...'.format(diff, command))
-            time.sleep(diff)
+        udp_object = self.get_own_udp_object()
+        responses = udp_object['responses']
+        response_received = udp_object['response_received']
 
-        self.LOGGER.info("Send command: '{}'".format(command))
-        timestamp = time.time()
+        # Only one command may wait on a drone's response list at a time,
+        # otherwise e.g. a keepalive thread could take another caller's reply
+        with udp_object['command_lock']:
+            # Commands very consecutive makes the drone not respond to them.
+            # So wait at least self.TIME_BTW_COMMANDS seconds
+            diff = time.monotonic() - self.last_received_command_timestamp
+            if diff < self.TIME_BTW_COMMANDS:
+                self.LOGGER.debug('Waiting %s seconds to execute command: %s...', diff, command)
+                time.sleep(diff)
 
-        client_socket.sendto(command.encode('utf-8'), self.address)
+            self.LOGGER.info("Send command: '%s'", command)
+            timestamp = time.monotonic()
+
+            response_received.clear()
+
+            client_socket.sendto(command.encode('utf-8'), self.address)
 
-        responses = self.get_own_udp_object()['responses']
+            while not responses:
+                remaining = timeout - (time.monotonic() - timestamp)
+                if remaining <= 0:
+                    message = "Aborting command '{}'. Did not receive a response after {} seconds".format(command, timeout)
+                    self.LOGGER.warning(message)
+                    return message
+                # Woken up by udp_response_receiver as soon as a response arrives
+                response_received.wait(remaining)
+                response_received.clear()
 
-        while not responses:
-            if time.time() - timestamp > timeout:
-                message = "Aborting command '{}'. Did not receive a response after {} seconds".format(command, timeout)
-                self.LOGGER.warning(message)
-                return message
-            time.sleep(0.1)  # Sleep during send command
+            self.last_received_command_timestamp = time.monotonic()
 
-        self.last_received_command_timestamp = time.time()
+            first_response = responses.pop(0)  # first datum from socket
 
-        first_response = responses.pop(0)  # first datum from socket
         try:
             response = first_response.decode("utf-8")
         except UnicodeDecodeError as e:
@@ -517,7 +531,7 @@ class Tello:
             return "response decode error"
         response = response.rstrip("\r\n")
 
-        self.LOGGER.info("Response {}: '{}'".format(command, response))
+        self.LOGGER.info("Response %s: '%s'", command, response)
         return response
 
     def send_command_without_return(self, command: str):
@@ -527,7 +541,7 @@ class Tello:
         global client_socket
         # Commands very consecutive makes the drone not respond to them. So wait at least self.TIME_BTW_COMMANDS seconds
 
-        self.LOGGER.info("Send command (no response expected): '{}'".format(command))
+        self.LOGGER.info("Send command (no response expected): '%s'", command)
         client_socket.sendto(command.encode('utf-8'), self.address)
 
     def send_control_command(self, command: str, timeout: int = RESPONSE_TIMEOUT) -> bool:
@@ -541,7 +555,7 @@ class Tello:
             if 'ok' in response.lower():
                 return True
 
-            self.LOGGER.debug("Command attempt #{} failed for command: '{}'".format(i, command))
+            self.LOGGER.debug("Command attempt #%s failed for command: '%s'", i, command)
 
         self.raise_result_error(command, response)
         return False # never reached
@@ -592,13 +606,14 @@ class Tello:
         """Enter SDK mode. Call this before any of the control functions.
         """
         self.send_control_command("command")
+        self.last_speed = None
 
         if wait_for_state:
             REPS = 20
             for i in range(REPS):
                 if self.get_current_state():
                     t = i / REPS  # in seconds
-                    Tello.LOGGER.debug("'.connect()' received first state packet after {} seconds".format(t))
+                    Tello.LOGGER.debug("'.connect()' received first state packet after %s seconds", t)
                     break
                 time.sleep(1 / REPS)
 
@@ -673,10 +688,15 @@ class Tello:
     def move(self, direction: str, x: int):
         """Tello fly up, down, left, right, forward or back with distance x cm.
         Users would normally call one of the move_x functions instead.
+        Distances below 20cm are rejected without sending a command, as
+        the drone would refuse them anyway.
         Arguments:
             direction: up, down, left, right, forward or back
             x: 20-500
         """
+        if x < self.MIN_MOVE_DISTANCE:
+            raise TelloException('Move distance must be >= {}cm, got {}'.format(self.MIN_MOVE_DISTANCE, x))
+
         self.send_control_command("{} {}".format(direction, x))
 
     def move_up(self, x: int):
@@ -865,11 +885,15 @@ class Tello:
         self.send_control_command("mdirection {}".format(x))
 
     def set_speed(self, x: int):
-        """Set speed to x cm/s.
+        """Set speed to x cm/s. Nothing is sent if the speed is already set.
         Arguments:
             x: 10-100
         """
+        if x == self.last_speed:
+            return
+
         self.send_control_command("speed {}".format(x))
+        self.last_speed = x
 
     def send_rc_control(self, left_right_velocity: int, forward_backward_velocity: int, up_down_velocity: int,
                         yaw_velocity: int):
@@ -883,8 +907,8 @@ class Tello:
         def clamp100(x: int) -> int:
             return max(-100, min(100, x))
 
-        if time.time() - self.last_rc_control_timestamp > self.TIME_BTW_RC_CONTROL_COMMANDS:
-            self.last_rc_control_timestamp = time.time()
+        if time.monotonic() - self.last_rc_control_timestamp > self.TIME_BTW_RC_CONTROL_COMMANDS:
+            self.last_rc_control_timestamp = time.monotonic()
             cmd = 'rc {} {} {} {}'.format(
                 clamp100(left_right_velocity),
                 clamp100(forward_backward_velocity),
@@ -1093,12 +1117,19 @@ class BackgroundFrameRead:
     backgroundFrameRead.frame to get the current frame.
     """
 
+    # When nobody read `frame` for IDLE_TIMEOUT seconds, only convert
+    # one decoded frame every IDLE_FRAME_INTERVAL seconds
+    IDLE_TIMEOUT = 2  # in seconds
+    IDLE_FRAME_INTERVAL = 1  # in seconds
+
     def __init__(self, tello, address, with_queue = False, maxsize = 32):
         self.address = address
         self.lock = Lock()
         self.frame = np.zeros([300, 400, 3], dtype=np.uint8)
         self.frames = deque([], maxsize)
         self.with_queue = with_queue
+        self.last_frame_request_time = time.monotonic()
+        self.last_frame_update_time = 0.0
 
         # Try grabbing frame with PyAV
         # According to issue #90 the decoder might need some time
@@ -1127,7 +1158,13 @@ class BackgroundFrameRead:
                 if self.with_queue:
                     self.frames.append(np.array(frame.to_image()))
                 else:
-                    self.frame = np.array(frame.to_image())
+                    # Frames still have to be decoded to keep the stream in sync,
+                    # but the RGB conversion is skipped while nobody is reading
+                    now = time.monotonic()
+                    idle = now - self.last_frame_request_time > self.IDLE_TIMEOUT
+                    if not idle or now - self.last_frame_update_time >= self.IDLE_FRAME_INTERVAL:
+                        self.frame = np.array(frame.to_image())
+                        self.last_frame_update_time = now
 
                 if self.stopped:
                     self.container.close()
@@ -1153,6 +1190,7 @@ class BackgroundFrameRead:
         if self.with_queue:
             return self.get_queued_frame()
 
+        self.last_frame_request_time = time.monotonic()
         with self.lock:
             return self._frame
 
@@ -10,6 +10,20 @@ from typing import Optional
 # Global variable to hold the swarm instance
 swarm: Optional[TelloSwarm] = None
 
+# Position axis and sign updated by each tracked movement command
+MOVEMENT_AXES = {
+    "move_forward": ("y", 1),
+    "move_back": ("y", -1),
+    "move_left": ("x", -1),
+    "move_right": ("x", 1),
+    "move_up": ("z", 1),
+    "move_down": ("z", -1)
+}
+ROTATION_SIGNS = {
+    "rotate_clockwise": 1,
+    "rotate_counter_clockwise": -1
+}
+
 # Position tracking variables - Updated for 2M x 2M boundary
 position_tracker = {
     "initial_height": 0,
@@ -374,17 +388,39 @@ def return_to_initial_position():
         print("❌ Swarm not available for return to center")
         return
 
-    # Use helper functions to return drones to center
-    return_drone_to_center(swarm.tellos[0], "Drone 1", drone1_pos)
-    return_drone_to_center(swarm.tellos[1], "Drone 2", drone2_pos)
+    # Use helper functions to return both drones to center at the same time,
+    # each drone only undoes its own offset
+    return_errors = []
 
-    # Reset individual drone position tracking since they're now centered
-    position_tracker["drone_positions"]["drone1"] = {
-        "x": 0, "y": 0, "z": 0, "rotation": 0
-    }
-    position_tracker["drone_positions"]["drone2"] = {
-        "x": 0, "y": 0, "z": 0, "rotation": 0
-    }
+    def return_worker(drone_instance, drone_id, position_offset):
+        try:
+            return_drone_to_center(drone_instance, drone_id, position_offset)
+        except Exception as e:
+            return_errors.append((drone_id, e))
+
+    return_threads = [
+        threading.Thread(target=return_worker,
+                         args=(swarm.tellos[0], "Drone 1", drone1_pos)),
+        threading.Thread(target=return_worker,
+                         args=(swarm.tellos[1], "Drone 2", drone2_pos))
+    ]
+    for thread in return_threads:
+        thread.start()
+    for thread in return_threads:
+        thread.join()
+
+    if return_errors:
+        for drone_id, error in return_errors:
+            print(f"❌ {drone_id} failed to return to center: {error}")
+        print("⚠️ Keeping tracked drone positions, drones may not be centered")
+    else:
+        # Reset individual drone position tracking since they're now centered
+        position_tracker["drone_positions"]["drone1"] = {
+            "x": 0, "y": 0, "z": 0, "rotation": 0
+        }
+        position_tracker["drone_positions"]["drone2"] = {
+            "x": 0, "y": 0, "z": 0, "rotation": 0
+        }
 
     # Step 3: Reset orientation for both drones
     sync_point("Resetting orientation to forward (0 degrees)")
@@ -751,6 +787,8 @@ def return_drone_to_center(drone_instance, drone_id, position_offset):
     """Helper to return an individual drone to center position"""
     return_x = -position_offset["x"]
     return_y = -position_offset["y"]
+    # position_tracker keys are "drone1"/"drone2", not "drone 1"
+    tracker_id = drone_id.lower().replace(" ", "")
 
     print(f"🏠 {drone_id} needs: x={return_x}, y={return_y}")
 
@@ -761,12 +799,12 @@ def return_drone_to_center(drone_instance, drone_id, position_offset):
             safe_command(drone_instance, "move_right", move_distance,
                          description=f"{drone_id} return X: {return_x}")
             track_movement("move_right", move_distance,
-                           f"{drone_id} return X", drone_id.lower())
+                           f"{drone_id} return X", tracker_id)
         else:
             safe_command(drone_instance, "move_left", move_distance,
                          description=f"{drone_id} return X: {return_x}")
             track_movement("move_left", move_distance,
-                           f"{drone_id} return X", drone_id.lower())
+                           f"{drone_id} return X", tracker_id)
         time.sleep(2)
 
     # Return Y position
@@ -776,12 +814,12 @@ def return_drone_to_center(drone_instance, drone_id, position_offset):
             safe_command(drone_instance, "move_forward", move_distance,
                          description=f"{drone_id} return Y: {return_y}")
             track_movement("move_forward", move_distance,
-                           f"{drone_id} return Y", drone_id.lower())
+                           f"{drone_id} return Y", tracker_id)
         else:
             safe_command(drone_instance, "move_back", move_distance,
                          description=f"{drone_id} return Y: {return_y}")
             track_movement("move_back", move_distance,
-                           f"{drone_id} return Y", drone_id.lower())
+                           f"{drone_id} return Y", tracker_id)
         time.sleep(2)
 
 
@@ -1092,42 +1130,15 @@ def track_movement(movement_type, distance, description="", drone_id=None):
     # Update position estimates
     if drone_id is None:  # Swarm movement
         pos = position_tracker["swarm_position"]
-        if movement_type == "move_forward":
-            pos["y"] += distance
-        elif movement_type == "move_back":
-            pos["y"] -= distance
-        elif movement_type == "move_left":
-            pos["x"] -= distance
-        elif movement_type == "move_right":
-            pos["x"] += distance
-        elif movement_type == "move_up":
-            pos["z"] += distance
-        elif movement_type == "move_down":
-            pos["z"] -= distance
-        elif movement_type in ["rotate_clockwise", "rotate_counter_clockwise"]:
-            if movement_type == "rotate_clockwise":
-                pos["rotation"] = (pos["rotation"] + distance) % 360
-            else:
-                pos["rotation"] = (pos["rotation"] - distance) % 360
     else:  # Individual drone movement
         pos = position_tracker["drone_positions"][drone_id]
-        if movement_type == "move_forward":
-            pos["y"] += distance
-        elif movement_type == "move_back":
-            pos["y"] -= distance
-        elif movement_type == "move_left":
-            pos["x"] -= distance
-        elif movement_type == "move_right":
-            pos["x"] += distance
-        elif movement_type == "move_up":
-            pos["z"] += distance
-        elif movement_type == "move_down":
-            pos["z"] -= distance
-        elif movement_type in ["rotate_clockwise", "rotate_counter_clockwise"]:
-            if movement_type == "rotate_clockwise":
-                pos["rotation"] = (pos["rotation"] + distance) % 360
-            else:
-                pos["rotation"] = (pos["rotation"] - distance) % 360
+
+    if movement_type in MOVEMENT_AXES:
+        axis, sign = MOVEMENT_AXES[movement_type]
+        pos[axis] += sign * distance
+    elif movement_type in ROTATION_SIGNS:
+        pos["rotation"] = (pos["rotation"] +
+                           ROTATION_SIGNS[movement_type] * distance) % 360
 
     debug_print(f"Tracked: {movement_type} {distance}cm - {description} "
                 f"(drone: {drone_id})")
@@ -216,53 +216,78 @@ class EmergencyStopGUI:
         """Send direct emergency commands to drones"""
         print("Sending direct emergency commands to drones...")
 
-        drones = []
-
-        # Create drone clients for each IP
-        for ip in self.drone_ips:
-            try:
-                drone = DroneClient(ip)
-                # Test connection first
-                response = drone.send_command("command")
-                if response:
-                    drones.append(drone)
-                    print(f"Connected to drone at {ip}")
-                else:
-                    print(f"No response from drone at {ip}")
-                    drone.close()
-            except Exception as e:
-                print(f"Failed to connect to drone at {ip}: {e}")
+        if not self.drone_ips:
+            print("No drones available for emergency stop!")
+            return
+
+        # Handle every drone in its own thread so one unresponsive drone's
+        # socket timeouts do not delay the emergency command to the others.
+        # Each thread records whether its drone answered the handshake.
+        reached = [False] * len(self.drone_ips)
 
-        if not drones:
+        def stop_drone(index, ip):
+            reached[index] = self.stop_single_drone(ip)
+
+        threads = [
+            threading.Thread(target=stop_drone, args=(index, ip), daemon=True)
+            for index, ip in enumerate(self.drone_ips)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if not any(reached):
             print("No drones available for emergency stop!")
             return
 
-        # Send emergency commands to all connected drones
-        for drone in drones:
-            try:
-                print(f"Sending emergency command to {drone.ip}...")
-                emergency_response = drone.emergency()
-                if emergency_response:
-                    print(f"Emergency response from {drone.ip}: {emergency_response}")
+        print("Emergency commands sent to all available drones.")
+
+    def stop_single_drone(self, ip):
+        """Connect to one drone and send emergency, falling back to land/stop
+
+        Returns:
+            True if the drone answered the connection handshake
+        """
+        try:
+            drone = DroneClient(ip)
+        except Exception as e:
+            print(f"Failed to connect to drone at {ip}: {e}")
+            return False
+
+        connected = False
+        try:
+            # Test connection first
+            response = drone.send_command("command")
+            if not response:
+                print(f"No response from drone at {ip}")
+                return False
+            connected = True
+            print(f"Connected to drone at {ip}")
+
+            print(f"Sending emergency command to {drone.ip}...")
+            emergency_response = drone.emergency()
+            if emergency_response:
+                print(f"Emergency response from {drone.ip}: {emergency_response}")
+            else:
+                print(f"No emergency response from {drone.ip}, trying land command...")
+                land_response = drone.land()
+                if land_response:
+                    print(f"Land response from {drone.ip}: {land_response}")
                 else:
-                    print(f"No emergency response from {drone.ip}, trying land command...")
-                    land_response = drone.land()
-                    if land_response:
-                        print(f"Land response from {drone.ip}: {land_response}")
+                    print(f"No response from {drone.ip}, trying stop command...")
+                    stop_response = drone.stop()
+                    if stop_response:
+                        print(f"Stop response from {drone.ip}: {stop_response}")
                     else:
-                        print(f"No response from {drone.ip}, trying stop command...")
-                        stop_response = drone.stop()
-                        if stop_response:
-                            print(f"Stop response from {drone.ip}: {stop_response}")
-                        else:
-                            print(f"No response from {drone.ip} for any command")
-
-            except Exception as e:
-                print(f"Error sending emergency command to {drone.ip}: {e}")
-            finally:
-                drone.close()
+                        print(f"No response from {drone.ip} for any command")
+            return True
 
-        print("Emergency commands sent to all available drones.")
+        except Exception as e:
+            print(f"Error sending emergency command to {drone.ip}: {e}")
+            return connected
+        finally:
+            drone.close()
 
     def kill_drone_processes(self):
         """Kill drone-related processes as backup"""
@@ -22,6 +22,7 @@ Usage:
 
 import json
 import logging
+import re
 import threading
 import sys
 import os
@@ -46,7 +47,7 @@ class ActionStatus(Enum):
     SWARM_NOT_CONNECTED = "swarm_not_connected"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     status: ActionStatus
     message: str
@@ -61,6 +62,78 @@ class ActionExecutor:
     # Command timeout settings (no retries)
     COMMAND_TIMEOUT = 5  # seconds
 
+    # Map flip directions to specific flip actions
+    FLIP_DIRECTION_MAPPING = {
+        "f": "flip_forward",
+        "forward": "flip_forward",
+        "b": "flip_back",
+        "back": "flip_back",
+        "l": "flip_left",
+        "left": "flip_left",
+        "r": "flip_right",
+        "right": "flip_right"
+    }
+
+    # Map action names to method names and parameter handling
+    ACTION_MAPPING = {
+        "takeoff": ("takeoff", ()),
+        "land": ("land", ()),
+        # Original move_ actions
+        "move_up": ("move_up", ("distance",)),
+        "move_down": ("move_down", ("distance",)),
+        "move_forward": ("move_forward", ("distance",)),
+        "move_back": ("move_back", ("distance",)),
+        "move_left": ("move_left", ("distance",)),
+        "move_right": ("move_right", ("distance",)),
+        # MCP handler compatible actions
+        "up": ("move_up", ("distance",)),
+        "down": ("move_down", ("distance",)),
+        "forward": ("move_forward", ("distance",)),
+        "back": ("move_back", ("distance",)),
+        "left": ("move_left", ("distance",)),
+        "right": ("move_right", ("distance",)),
+        # Rotation actions
+        "rotate_clockwise": ("rotate_clockwise", ("degrees",)),
+        "rotate_counter_clockwise": ("rotate_counter_clockwise", ("degrees",)),
+        "rotate_counterclockwise": ("rotate_counter_clockwise", ("degrees",)),
+        "cw": ("rotate_clockwise", ("degrees",)),
+        "ccw": ("rotate_counter_clockwise", ("degrees",)),
+        # Flip actions
+        "flip_forward": ("flip_forward", ()),
+        "flip_back": ("flip_back", ()),
+        "flip_left": ("flip_left", ()),
+        "flip_right": ("flip_right", ()),
+        "emergency": ("emergency", ()),
+        "move": ("move", ("x", "y", "z"))
+    }
+
+    # Substrings of error messages/types that indicate UDP or network trouble,
+    # compiled once so each check is a single case-insensitive scan
+    CONNECTION_ERROR_PATTERN = re.compile("|".join(re.escape(indicator) for indicator in [
+        "telloexception",
+        "timeout",
+        "did not receive a response",
+        "aborting command",
+        "unsuccessful",
+        "connection",
+        "network",
+        "socket",
+        "udp",
+        "port",
+        "refused",
+        "unreachable",
+        "no response",
+        "response not received",
+        "command failed",
+        "not connected",
+        "disconnected",
+        "communication error",
+        "transmission failed",
+        "response timeout",
+        "send failed",
+        "receive failed"
+    ]), re.IGNORECASE)
+
     def __init__(self):
         """
         Initialize ActionExecutor
@@ -79,7 +152,7 @@ class ActionExecutor:
         self.stop_keepalive = threading.Event()
         self.keepalive_interval = 14  # seconds
         self.action_lock = threading.Lock()
-        self.last_action_time = time.time()
+        self.last_action_time = time.monotonic()
 
         # Note: drone_hosts parameter is kept for future compatibility
         # Currently using WSL-specific configuration regardless of this parameter
@@ -100,39 +173,13 @@ class ActionExecutor:
         Returns:
             True if the error is connection-related
         """
-        error_str = str(error).lower()
-        error_type = str(type(error)).lower()
-
-        connection_indicators = [
-            "telloexception",
-            "timeout",
-            "did not receive a response",
-            "aborting command",
-            "unsuccessful",
-            "connection",
-            "network",
-            "socket",
-            "udp",
-            "port",
-            "refused",
-            "unreachable",
-            "no response",
-            "response not received",
-            "command failed",
-            "not connected",
-            "disconnected",
-            "communication error",
-            "transmission failed",
-            "response timeout",
-            "send failed",
-            "receive failed"
-        ]
-
-        is_connection_error = any(indicator in error_str or indicator in error_type.lower()
-                                 for indicator in connection_indicators)
+        is_connection_error = bool(
+            self.CONNECTION_ERROR_PATTERN.search(str(error))
+            or self.CONNECTION_ERROR_PATTERN.search(str(type(error)))
+        )
 
         if is_connection_error:
-            self.logger.debug(f"Detected connection error: {error}")
+            self.logger.debug("Detected connection error: %s", error)
 
         return is_connection_error
 
@@ -153,7 +200,7 @@ class ActionExecutor:
                 if drone.response_thread and drone.response_thread.is_alive():
                     drone.response_thread = None
         except Exception as e:
-            self.logger.warning(f"Error resetting drone state: {e}")
+            self.logger.warning("Error resetting drone state: %s", e)
 
     def setup_swarm(self):
         """Initialize the TelloSwarm with WSL-compatible configuration
@@ -181,7 +228,7 @@ class ActionExecutor:
         self.drone_map["drone_1"] = drone1
         # self.drone_map["drone_2"] = drone2
 
-        self.logger.info(f"TelloSwarm created with {len(drones)} drones")
+        self.logger.info("TelloSwarm created with %s drones", len(drones))
 
     def connect_swarm(self) -> ActionResult:
         """
@@ -198,39 +245,52 @@ class ActionExecutor:
                 )
 
             try:
-                start_time = time.time()
+                start_time = time.monotonic()
                 self.logger.info("Connecting to drone swarm...")
                 if self.swarm:
                     # Instead of using swarm.connect() which can throw unhandled thread exceptions,
                     # connect to individual drones to have better error control
-                    connection_errors = []
-                    successful_connections = 0
+                    drone_items = list(self.drone_map.items())
+                    # One error slot per drone (None on success), filled by the connect threads
+                    error_slots = [None] * len(drone_items)
 
-                    for drone_id, drone in self.drone_map.items():
+                    def connect_drone(index, drone_id, drone):
                         try:
-                            self.logger.info(f"Connecting to {drone_id}...")
+                            self.logger.info("Connecting to %s...", drone_id)
                             drone.connect()
-                            successful_connections += 1
-                            self.logger.info(f"Successfully connected to {drone_id}")
+                            self.logger.info("Successfully connected to %s", drone_id)
 
                         except Exception as drone_error:
-                            error_msg = f"{drone_id}: {str(drone_error)}"
-                            connection_errors.append(error_msg)
-                            self.logger.error(f"Failed to connect to {drone_id}: {drone_error}")
+                            error_slots[index] = f"{drone_id}: {str(drone_error)}"
+                            self.logger.error("Failed to connect to %s: %s", drone_id, drone_error)
                             # Ensure drone state is reset after failed connection
                             self._reset_drone_state(drone)
 
+                    # Connect all drones at once so an unreachable drone's retries
+                    # and timeouts do not delay connecting the others
+                    connect_threads = [
+                        threading.Thread(target=connect_drone, args=(index, drone_id, drone))
+                        for index, (drone_id, drone) in enumerate(drone_items)
+                    ]
+                    for thread in connect_threads:
+                        thread.start()
+                    for thread in connect_threads:
+                        thread.join()
+
+                    connection_errors = [error for error in error_slots if error is not None]
+                    successful_connections = len(drone_items) - len(connection_errors)
+
                     # If at least one drone connected successfully, consider it a partial success
                     if successful_connections > 0:
                         self.connected = True
-                        execution_time = time.time() - start_time
+                        execution_time = time.monotonic() - start_time
 
                         if connection_errors:
                             message = f"Partially connected ({successful_connections}/{len(self.drone_map)} drones). Errors: {'; '.join(connection_errors)}"
                             self.logger.warning(message)
                         else:
                             message = f"Successfully connected to all {successful_connections} drones"
-                            self.logger.info(f"Successfully connected to swarm in {execution_time:.2f}s")
+                            self.logger.info("Successfully connected to swarm in %.2fs", execution_time)
 
                         return ActionResult(
                             status=ActionStatus.SUCCESS,
@@ -251,7 +311,7 @@ class ActionExecutor:
                 )
 
             except Exception as e:
-                self.logger.error(f"Failed to connect to swarm: {e}")
+                self.logger.error("Failed to connect to swarm: %s", e)
                 # Make sure connected flag is false on failure
                 self.connected = False
                 return ActionResult(
@@ -292,7 +352,7 @@ class ActionExecutor:
                 )
 
             except Exception as e:
-                self.logger.error(f"Failed to disconnect from swarm: {e}")
+                self.logger.error("Failed to disconnect from swarm: %s", e)
                 return ActionResult(
                     status=ActionStatus.FAILED,
                     message="Failed to disconnect from swarm",
@@ -326,8 +386,8 @@ class ActionExecutor:
             parameters = action_data.get("parameters", {})
 
             self.logger.info(
-                f"Executing action: {action} for drone: {drone_id} "
-                f"with parameters: {parameters}"
+                "Executing action: %s for drone: %s with parameters: %s",
+                action, drone_id, parameters
             )
 
             # Check if swarm is connected, try to connect once if not
@@ -335,7 +395,7 @@ class ActionExecutor:
                 self.logger.info("Drone not connected, attempting to connect...")
                 connect_result = self.connect_swarm()
                 if connect_result.status != ActionStatus.SUCCESS:
-                    self.logger.warning(f"Connection failed: {connect_result.message}")
+                    self.logger.warning("Connection failed: %s", connect_result.message)
                     # Continue processing but return a warning - don't stop AWS IoT processing
                     return ActionResult(
                         status=ActionStatus.SUCCESS,
@@ -349,7 +409,7 @@ class ActionExecutor:
                 return result
             except Exception as action_error:
                 error_msg = str(action_error)
-                self.logger.warning(f"Action execution failed: {error_msg}")
+                self.logger.warning("Action execution failed: %s", error_msg)
 
                 # If it's a connection-related error, reset connection status
                 if self._is_connection_error(action_error):
@@ -366,7 +426,7 @@ class ActionExecutor:
 
         except Exception as e:
             error_msg = str(e)
-            self.logger.warning(f"Error in execute_action: {error_msg}")
+            self.logger.warning("Error in execute_action: %s", error_msg)
             # Even for unexpected errors, continue operation
             return ActionResult(
                 status=ActionStatus.SUCCESS,
@@ -391,11 +451,11 @@ class ActionExecutor:
             if "droneID" in message and "action" in message:
                 return message
 
-            self.logger.warning(f"Unrecognized message format: {message}")
+            self.logger.warning("Unrecognized message format: %s", message)
             return None
 
         except Exception as e:
-            self.logger.error(f"Failed to parse message: {e}")
+            self.logger.error("Failed to parse message: %s", e)
             return None
 
     def _execute_drone_action(self, drone_id: Optional[str], action: Optional[str],
@@ -411,16 +471,16 @@ class ActionExecutor:
             if drone_id == "all" or drone_id is None:
                 # Execute on all drones individually to avoid swarm.parallel() thread issues
                 target_name = "all drones"
-                start_time = time.time()
+                start_time = time.monotonic()
 
                 results = []
                 for individual_drone_id, drone in self.drone_map.items():
                     try:
                         result = self._safe_execute_command(drone, action, parameters)
                         results.append((individual_drone_id, result))
-                        self.logger.info(f"Action {action} on {individual_drone_id}: {result.status.value}")
+                        self.logger.info("Action %s on %s: %s", action, individual_drone_id, result.status.value)
                     except Exception as drone_error:
-                        self.logger.error(f"Error executing {action} on {individual_drone_id}: {drone_error}")
+                        self.logger.error("Error executing %s on %s: %s", action, individual_drone_id, drone_error)
                         results.append((individual_drone_id, ActionResult(
                             status=ActionStatus.FAILED,
                             message=f"Failed to execute {action}",
@@ -460,12 +520,12 @@ class ActionExecutor:
                         drone_id=drone_id
                     )
 
-                start_time = time.time()
+                start_time = time.monotonic()
                 # Execute the action on individual drone
                 final_result = self._safe_execute_command(target, action, parameters)
 
             final_result.drone_id = drone_id
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             final_result.execution_time = execution_time
 
             # Update last action timestamp
@@ -473,14 +533,14 @@ class ActionExecutor:
                 self.last_action_time = start_time
 
             self.logger.info(
-                f"Action {action} on {target_name} completed: "
-                f"{final_result.status.value}"
+                "Action %s on %s completed: %s",
+                action, target_name, final_result.status.value
             )
             return final_result
 
         except Exception as e:
             self.logger.error(
-                f"Error executing action {action} on {drone_id}: {e}"
+                "Error executing action %s on %s: %s", action, drone_id, e
             )
             return ActionResult(
                 status=ActionStatus.FAILED,
@@ -491,10 +551,10 @@ class ActionExecutor:
 
     def _execute_with_timeout(self, tello, method_name, args):
         """Execute a command on a single drone with timeout and robust error handling"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            if time.time() - start_time > self.COMMAND_TIMEOUT:
+            if time.monotonic() - start_time > self.COMMAND_TIMEOUT:
                 return False, f"Command timed out after {self.COMMAND_TIMEOUT}s"
 
             method = getattr(tello, method_name)
@@ -504,7 +564,7 @@ class ActionExecutor:
         except Exception as e:
             error_str = str(e).lower()
             # Log the error but don't propagate it to maintain robustness
-            self.logger.warning(f"Drone UDP call failed for {method_name}: {e}")
+            self.logger.warning("Drone UDP call failed for %s: %s", method_name, e)
 
             # Check if this is a connection-related error
             if self._is_connection_error(e):
@@ -516,28 +576,31 @@ class ActionExecutor:
 
     def _execute_swarm_command(self, swarm, method_name, args):
         """Execute command on swarm with robust individual drone failure handling"""
-        results = []
+        # One result slot per drone, filled in place by the swarm's worker threads
+        slots = [None] * len(swarm.tellos)
         successful = False
 
         def worker(i, tello):
             try:
                 success, error = self._execute_with_timeout(tello, method_name, args)
-                results.append((i, success, error))
+                slots[i] = (i, success, error)
                 if success:
                     nonlocal successful
                     successful = True
             except Exception as e:
                 error_msg = f"Worker exception: {str(e)}"
-                self.logger.warning(f"Swarm worker {i} failed: {error_msg}")
-                results.append((i, False, error_msg))
+                self.logger.warning("Swarm worker %s failed: %s", i, error_msg)
+                slots[i] = (i, False, error_msg)
 
         # Execute commands in parallel with exception handling
         try:
             swarm.parallel(worker)
         except Exception as parallel_error:
-            self.logger.warning(f"Swarm parallel execution had issues: {parallel_error}")
+            self.logger.warning("Swarm parallel execution had issues: %s", parallel_error)
             # Even if parallel execution fails, we may have some results
 
+        results = [result for result in slots if result is not None]
+
         # Process results with robust error handling
         failures = []
         connection_errors = []
@@ -596,19 +659,8 @@ class ActionExecutor:
         # Handle generic "flip" action by mapping direction to specific flip
         if action == "flip" and "direction" in parameters:
             direction = parameters["direction"].lower()
-            direction_mapping = {
-                "f": "flip_forward",
-                "forward": "flip_forward",
-                "b": "flip_back",
-                "back": "flip_back",
-                "l": "flip_left",
-                "left": "flip_left",
-                "r": "flip_right",
-                "right": "flip_right"
-            }
-
-            if direction in direction_mapping:
-                action = direction_mapping[direction]
+            if direction in self.FLIP_DIRECTION_MAPPING:
+                action = self.FLIP_DIRECTION_MAPPING[direction]
                 self.logger.info(
                     "Mapped flip direction '%s' to action '%s'",
                     direction, action
@@ -621,46 +673,13 @@ class ActionExecutor:
                             f"left, right"
                 )
 
-        # Map action names to method names and parameter handling
-        action_mapping = {
-            "takeoff": ("takeoff", []),
-            "land": ("land", []),
-            # Original move_ actions
-            "move_up": ("move_up", ["distance"]),
-            "move_down": ("move_down", ["distance"]),
-            "move_forward": ("move_forward", ["distance"]),
-            "move_back": ("move_back", ["distance"]),
-            "move_left": ("move_left", ["distance"]),
-            "move_right": ("move_right", ["distance"]),
-            # MCP handler compatible actions
-            "up": ("move_up", ["distance"]),
-            "down": ("move_down", ["distance"]),
-            "forward": ("move_forward", ["distance"]),
-            "back": ("move_back", ["distance"]),
-            "left": ("move_left", ["distance"]),
-            "right": ("move_right", ["distance"]),
-            # Rotation actions
-            "rotate_clockwise": ("rotate_clockwise", ["degrees"]),
-            "rotate_counter_clockwise": ("rotate_counter_clockwise", ["degrees"]),
-            "rotate_counterclockwise": ("rotate_counter_clockwise", ["degrees"]),
-            "cw": ("rotate_clockwise", ["degrees"]),
-            "ccw": ("rotate_counter_clockwise", ["degrees"]),
-            # Flip actions
-            "flip_forward": ("flip_forward", []),
-            "flip_back": ("flip_back", []),
-            "flip_left": ("flip_left", []),
-            "flip_right": ("flip_right", []),
-            "emergency": ("emergency", []),
-            "move": ("move", ["x", "y", "z"])
-        }
-
-        if action not in action_mapping:
+        if action not in self.ACTION_MAPPING:
             return ActionResult(
                 status=ActionStatus.INVALID_COMMAND,
                 message=f"Unknown action: {action}"
             )
 
-        method_name, param_names = action_mapping[action]
+        method_name, param_names = self.ACTION_MAPPING[action]
 
         # Check if target has the method
         if not hasattr(target, method_name):
@@ -702,7 +721,7 @@ class ActionExecutor:
                     )
                 else:
                     # Log the error but treat UDP failures as non-critical
-                    self.logger.warning(f"Drone UDP call failed for {action}: {error}")
+                    self.logger.warning("Drone UDP call failed for %s: %s", action, error)
 
                     # Check if this is a connection error and mark connection as failed
                     if self._is_connection_error(Exception(error)):
@@ -719,7 +738,7 @@ class ActionExecutor:
         except Exception as e:
             # Handle any unexpected errors robustly
             error_msg = str(e)
-            self.logger.warning(f"Exception during {action} execution: {error_msg}")
+            self.logger.warning("Exception during %s execution: %s", action, error_msg)
 
             # Check if this is a connection error and mark connection as failed
             if self._is_connection_error(e):
@@ -742,26 +761,27 @@ class ActionExecutor:
             try:
                 battery = tello.get_battery()
                 drone_id = f"drone_{i + 1}"
-                self.logger.info(f"{drone_id} battery: {battery}%")
+                self.logger.info("%s battery: %s%%", drone_id, battery)
 
                 if battery < 20:
-                    self.logger.warning(f"{drone_id} battery critically low: {battery}%")
+                    self.logger.warning("%s battery critically low: %s%%", drone_id, battery)
                 elif battery < 50:
-                    self.logger.warning(f"{drone_id} battery low: {battery}%")
+                    self.logger.warning("%s battery low: %s%%", drone_id, battery)
             except Exception as e:
-                self.logger.error(f"Could not get battery for drone_{i + 1}: {e}")
+                self.logger.error("Could not get battery for drone_%s: %s", i + 1, e)
 
     def _send_keepalive(self):
         """Send keepalive signals to all drones periodically"""
         while not self.stop_keepalive.is_set():
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Skip keepalive if there was a recent action
             with self.action_lock:
                 time_since_last_action = current_time - self.last_action_time
                 if time_since_last_action < self.keepalive_interval:
                     self.logger.debug(
-                        f"Skipping keepalive, last action was {time_since_last_action:.1f}s ago"
+                        "Skipping keepalive, last action was %.1fs ago",
+                        time_since_last_action
                     )
                     # Wait for the remaining time until next interval
                     wait_time = self.keepalive_interval - time_since_last_action
@@ -773,7 +793,7 @@ class ActionExecutor:
                     self.swarm.parallel(lambda i,t: t.send_keepalive())
                     # print("Sending skippedkeepalive to all drones")
                 except Exception as e:
-                    self.logger.error(f"Error in keepalive thread: {e}")
+                    self.logger.error("Error in keepalive thread: %s", e)
 
             # Wait for the specified interval
             self.stop_keepalive.wait(self.keepalive_interval)
@@ -819,23 +839,35 @@ class ActionExecutor:
         for i, tello in enumerate(self.swarm.tellos):
             try:
                 drone_id = f"drone_{i + 1}"
-                self.logger.info(f"Emergency stop for {drone_id}")
+                self.logger.info("Emergency stop for %s", drone_id)
                 tello.emergency()
             except Exception as e:
-                self.logger.error(f"Emergency command failed for drone_{i + 1}: {e}")
+                self.logger.error("Emergency command failed for drone_%s: %s", i + 1, e)
 
         # End connection
         try:
             self.swarm.end()
             self.connected = False
         except Exception as e:
-            self.logger.error(f"Failed to end connection during emergency stop: {e}")
+            self.logger.error("Failed to end connection during emergency stop: %s", e)
 
         return ActionResult(
             status=ActionStatus.SUCCESS,
             message="Emergency stop completed"
         )
 
+    def __enter__(self):
+        """Use the executor as a context manager"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Cleanup when leaving a with block"""
+        if self.connected:
+            # disconnect_swarm also stops the keepalive thread
+            self.disconnect_swarm()
+        else:
+            self._stop_keepalive()
+
     def __del__(self):
         """Cleanup on destruction"""
         try:
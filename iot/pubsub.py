@@ -16,6 +16,9 @@ import configparser
 
 TIMEOUT = 5
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -25,7 +28,7 @@ logging.basicConfig(
 def load_settings(settings_path: str) -> dict:
     try:
         with open(settings_path, "r", encoding="utf-8") as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=YAML_LOADER)
     except Exception as e:
         logging.error("Failed to load settings: %s", e)
         raise
@@ -272,11 +275,11 @@ def main():
 
         # Try Tello executor first, fallback to simulator if not available
 
-        executor = ActionExecutor()
-        logging.info("Using Tello executor")
+        with ActionExecutor() as executor:
+            logging.info("Using Tello executor")
 
-        client = PubSubClient(settings, executor)
-        client.run()
+            client = PubSubClient(settings, executor)
+            client.run()
     except Exception as e:
         logging.error("Exception occurred in main loop: %s", e)
 
@@ -1,9 +1,26 @@
 from djitellopy import TelloSwarm, Tello
+import threading
 import time
 
 
 drone_hosts = ["192.168.137.21", "192.168.137.22"]  # Legacy default
 
+# Tello lands automatically after 15s without a command
+KEEPALIVE_INTERVAL = 10  # seconds
+
+
+def keepalive_loop(swarm, stop_event):
+    """Send keepalive to every drone until stop_event is set"""
+    while not stop_event.is_set():
+        # Send to each drone from this thread rather than swarm.parallel,
+        # which must only be driven by one thread at a time
+        for i, tello in enumerate(swarm.tellos):
+            try:
+                tello.send_keepalive()
+            except Exception as e:
+                print(f"Drone {i+1} keepalive failed: {e}")
+        stop_event.wait(KEEPALIVE_INTERVAL)
+
 
 # Real drone
 drone1 = Tello(host=drone_hosts[0])
@@ -17,6 +34,14 @@ swarm.connect()
 # Print battery level for each drone in the swarm
 for i, tello in enumerate(swarm.tellos):
     print(f"Drone {i+1} battery: {tello.get_battery()}%")
+
+# Keep drones alive from a dedicated thread, independent of the sleeps below
+stop_keepalive = threading.Event()
+keepalive_thread = threading.Thread(
+    target=keepalive_loop, args=(swarm, stop_keepalive), daemon=True
+)
+keepalive_thread.start()
+
 # Send a command to all drones in the swarm
 
 swarm.takeoff()
@@ -26,20 +51,19 @@ time.sleep(5)
 
 
 
-swarm.parallel(lambda i,t: t.send_keepalive())
 time.sleep(14)
 print("1st 14s")
 
 swarm.parallel(lambda i,t: t.move_up(50))
 print("All drones moved up successfully")
 time.sleep(14)
-# for tello in swarm:
-#     print(tello.send_keepalive())
-swarm.parallel(lambda i,t: t.send_keepalive())
 
 time.sleep(14)
 print("2nd 14s")
 print("Keepalive sent successfully")
+
+stop_keepalive.set()
+keepalive_thread.join()
 # Land all drones in the swarm
 swarm.land()
 print("All drones landed successfully")
@@ -158,7 +158,7 @@ class EnhancedMockTelloDrone(MockTelloDrone):
                     state_str = self._build_state_string()
 
                     # Send to all known client addresses on the state port
-                    for client_addr in list(self.client_addresses):
+                    for client_addr in self.client_addresses:
                         try:
                             # Send state to client's host on state port
                             state_addr = (client_addr[0], self.STATE_PORT)
@@ -167,7 +167,7 @@ class EnhancedMockTelloDrone(MockTelloDrone):
                             )
                         except Exception:
                             # Remove failed addresses
-                            self.client_addresses.discard(client_addr)
+                            self._remove_client_address(client_addr)
 
                 # Update dynamic state values
                 self._update_dynamic_state()
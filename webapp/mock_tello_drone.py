@@ -76,8 +76,10 @@ class MockTelloDrone:
         self.state_thread = None
         self.running = False
 
-        # Store client addresses for responses
-        self.client_addresses = set()
+        # Store client addresses for responses. Replaced copy-on-write under
+        # client_lock so broadcasters can iterate it without copying
+        self.client_addresses = frozenset()
+        self.client_lock = threading.Lock()
 
         # Command responses
         self.command_responses = {
@@ -221,7 +223,7 @@ class MockTelloDrone:
                     continue
 
                 # Store client address for state broadcasting
-                self.client_addresses.add(client_addr)
+                self._add_client_address(client_addr)
 
                 self.logger.info(
                     "✅ PROCESSING: Command from %s: '%s'", client_addr, command
@@ -555,6 +557,18 @@ class MockTelloDrone:
         # Predictable battery drain (1% per rotation command)
         self.state['bat'] = max(0, self.state['bat'] - 1)
 
+    def _add_client_address(self, client_addr):
+        """Add a client address, replacing the set only when it is new"""
+        if client_addr in self.client_addresses:
+            return
+        with self.client_lock:
+            self.client_addresses = self.client_addresses | {client_addr}
+
+    def _remove_client_address(self, client_addr):
+        """Remove a client address by swapping in a new set"""
+        with self.client_lock:
+            self.client_addresses = self.client_addresses - {client_addr}
+
     def _state_broadcaster(self):
         """Broadcast state information periodically"""
         self.logger.info("State broadcaster started")
@@ -566,7 +580,7 @@ class MockTelloDrone:
                     state_str = self._build_state_string()
 
                     # Send to all known client addresses on the state port
-                    for client_addr in list(self.client_addresses):
+                    for client_addr in self.client_addresses:
                         try:
                             # Send state to client's host on state port
                             state_addr = (client_addr[0], self.STATE_PORT)
@@ -575,7 +589,7 @@ class MockTelloDrone:
                             )
                         except Exception:
                             # Remove failed addresses
-                            self.client_addresses.discard(client_addr)
+                            self._remove_client_address(client_addr)
 
                 # Update dynamic state values
                 self._update_dynamic_state()
@@ -615,12 +629,12 @@ class MockTelloDrone:
         """Force immediate state broadcast after reset"""
         if self.sdk_mode and self.client_addresses:
             state_str = self._build_state_string()
-            for client_addr in list(self.client_addresses):
+            for client_addr in self.client_addresses:
                 try:
                     state_addr = (client_addr[0], self.STATE_PORT)
                     self.state_socket.sendto(state_str.encode('ascii'), state_addr)
                 except Exception:
-                    self.client_addresses.discard(client_addr)
+                    self._remove_client_address(client_addr)
             self.logger.info("🔄 Forced state broadcast after reset")
 
 
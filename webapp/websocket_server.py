@@ -61,20 +61,23 @@ class DroneWebSocketServer:
         """Broadcast message to all connected clients"""
         if self.clients:
             message_str = json.dumps(message)
-            disconnected = set()
+            clients = list(self.clients)
 
-            for client in self.clients:
-                try:
-                    await client.send(message_str)
-                except websockets.exceptions.ConnectionClosed:
-                    disconnected.add(client)
-                except Exception as e:
-                    logger.error(f"Error sending message to client: {e}")
-                    disconnected.add(client)
+            # Send to all clients concurrently so a slow client does not
+            # delay state updates for the others
+            results = await asyncio.gather(
+                *(client.send(message_str) for client in clients),
+                return_exceptions=True,
+            )
 
             # Remove disconnected clients
-            for client in disconnected:
-                self.clients.discard(client)
+            for client, result in zip(clients, results):
+                if isinstance(result, Exception):
+                    if not isinstance(
+                        result, websockets.exceptions.ConnectionClosed
+                    ):
+                        logger.error(f"Error sending message to client: {result}")
+                    self.clients.discard(client)
 
     async def handle_client_message(self, websocket, message_str):
         """Handle incoming message from client"""